@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import hashlib
+import copy
 import json
+import os
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from aigov_ep.utils.io import write_json
+from aigov_ep.utils.hashing import sha256_file, sha256_files
+from aigov_ep.utils.io import write_json_and_hash
 
 
 _REDACTED = "[redacted]"
@@ -22,20 +25,13 @@ _SENSITIVE_MARKERS = (
     "auth",
     "bearer",
 )
-
-
-def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+# Markers are already lower-case; one alternation scans each key once.
+_SENSITIVE_RE = re.compile("|".join(re.escape(marker) for marker in _SENSITIVE_MARKERS))
 
 
 def write_checksums(path: Path, entries: list[tuple[str, str]]) -> None:
     with open(path, "w", encoding="utf-8") as handle:
-        for checksum, rel_path in entries:
-            handle.write(f"{checksum}  {rel_path}\n")
+        handle.write("".join(f"{checksum}  {rel_path}\n" for checksum, rel_path in entries))
 
 
 def write_run_manifest(
@@ -47,21 +43,32 @@ def write_run_manifest(
     run_meta_path: Path,
     target_name: str,
     target_config: Dict[str, Any],
+    scenario_checksum: Optional[str] = None,
+    transcript_checksum: Optional[str] = None,
+    run_meta_checksum: Optional[str] = None,
+    now: Optional[str] = None,
+    config_safe: bool = False,
 ) -> Path:
     scenario_rel = _relative_path(run_dir, scenario_json_path)
     transcript_rel = _relative_path(run_dir, transcript_path)
     run_meta_rel = _relative_path(run_dir, run_meta_path)
 
-    scenario_checksum = sha256_file(scenario_json_path)
-    transcript_checksum = sha256_file(transcript_path)
-    run_meta_checksum = sha256_file(run_meta_path)
+    # Callers that just wrote these files pass the checksums along; only
+    # hash from disk when they are not known.
+    scenario_checksum, transcript_checksum, run_meta_checksum = _resolve_checksums(
+        [
+            (scenario_json_path, scenario_checksum),
+            (transcript_path, transcript_checksum),
+            (run_meta_path, run_meta_checksum),
+        ]
+    )
 
     manifest: Dict[str, Any] = {
         "manifest_version": "0.1",
-        "created_at_utc": _utc_now(),
+        "created_at_utc": now or _utc_now(),
         "target": {
             "name": target_name,
-            "config": _sanitize_config(target_config),
+            "config": _redacted_config(target_config, config_safe),
         },
         "scenario": {"path": scenario_rel, "checksum": scenario_checksum},
         "transcript": {"path": transcript_rel, "checksum": transcript_checksum},
@@ -73,9 +80,7 @@ def write_run_manifest(
         manifest["bundle"] = bundle_info
 
     manifest_path = run_dir / "run_manifest.json"
-    write_json(manifest_path, manifest)
-
-    manifest_checksum = sha256_file(manifest_path)
+    manifest_checksum = write_json_and_hash(manifest_path, manifest)
     checksums_path = run_dir / "checksums.sha256"
     write_checksums(
         checksums_path,
@@ -89,6 +94,39 @@ def write_run_manifest(
     return manifest_path
 
 
+def _resolve_checksums(entries: list[tuple[Path, Optional[str]]]) -> list[str]:
+    missing = [path for path, checksum in entries if not checksum]
+    computed = iter(sha256_files(missing))
+    return [checksum or next(computed) for _, checksum in entries]
+
+
+def _redacted_config(config: Dict[str, Any], config_safe: bool = False) -> Dict[str, Any]:
+    if not config:
+        return {}
+    if config_safe:
+        # The adapter declared its config free of secrets (sanitized_config_safe).
+        return copy.copy(config)
+    # Most configs carry no secrets; only copy when something must be redacted.
+    if not _has_sensitive_key(config):
+        return config
+    return _sanitize_config(config)
+
+
+def _has_sensitive_key(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, child in item.items():
+                if _is_sensitive_key(key):
+                    return True
+                if isinstance(child, (dict, list)):
+                    stack.append(child)
+        elif isinstance(item, list):
+            stack.extend(child for child in item if isinstance(child, (dict, list)))
+    return False
+
+
 def _sanitize_config(value: Any) -> Any:
     if isinstance(value, dict):
         sanitized: Dict[str, Any] = {}
@@ -106,39 +144,71 @@ def _sanitize_config(value: Any) -> Any:
 def _is_sensitive_key(key: Any) -> bool:
     if not isinstance(key, str):
         return False
-    lower = key.lower()
-    return any(marker in lower for marker in _SENSITIVE_MARKERS)
+    # Config keys are usually already lower-case; skip the lower() copy then.
+    if not key.islower():
+        key = key.lower()
+    return _SENSITIVE_RE.search(key) is not None
 
 
 def _relative_path(root: Path, path: Path) -> str:
-    try:
-        rel = path.relative_to(root)
-    except ValueError:
-        rel = path
-    return str(rel)
+    # Lexical prefix check on the string forms, like Path.relative_to, without
+    # building intermediate PurePath objects. Relative paths always use POSIX
+    # separators so manifests and checksums files are identical across OSes.
+    root_str = os.fspath(root)
+    path_str = os.fspath(path)
+    if path_str == root_str:
+        return "."
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if path_str.startswith(prefix):
+        return path_str[len(prefix):].replace(os.sep, "/")
+    return path_str
 
 
 def _find_bundle_info(scenario_source_path: Optional[Path]) -> Optional[Dict[str, Any]]:
     if not scenario_source_path:
         return None
-    current = scenario_source_path.resolve()
-    for parent in current.parents:
-        manifest_path = parent / "bundle_manifest.json"
-        if manifest_path.exists():
-            info: Dict[str, Any] = {
-                "bundle_dir": str(parent),
-                "bundle_manifest_checksum": sha256_file(manifest_path),
-            }
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as handle:
-                    manifest = json.load(handle)
-            except json.JSONDecodeError:
-                manifest = {}
-            bundle_hash = manifest.get("bundle_hash")
-            if isinstance(bundle_hash, str) and bundle_hash:
-                info["bundle_hash"] = bundle_hash
-            return info
-    return None
+    source_dir = os.path.dirname(os.path.realpath(os.fspath(scenario_source_path)))
+    manifest_path = _find_bundle_manifest(source_dir)
+    if manifest_path is None:
+        return None
+    try:
+        checksum = sha256_file(manifest_path)
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except FileNotFoundError:
+        # Removed between the lookup and the read.
+        return None
+    except json.JSONDecodeError:
+        manifest = {}
+    info: Dict[str, Any] = {
+        "bundle_dir": os.path.dirname(manifest_path),
+        "bundle_manifest_checksum": checksum,
+    }
+    bundle_hash = manifest.get("bundle_hash")
+    if isinstance(bundle_hash, str) and bundle_hash:
+        info["bundle_hash"] = bundle_hash
+    return info
+
+
+def _find_bundle_manifest(dir_str: str) -> Optional[str]:
+    """Return the nearest bundle_manifest.json at or above ``dir_str``.
+
+    One os.stat per level on plain strings. Results are not cached: bundles
+    can be compiled or removed while the process runs, and checking that a
+    cached hit is still the nearest manifest costs the same stats as the walk.
+    """
+    current = dir_str
+    while True:
+        candidate = os.path.join(current, "bundle_manifest.json")
+        try:
+            os.stat(candidate)
+        except OSError:
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+            continue
+        return candidate
 
 
 def _utc_now() -> str:
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import json
-import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
 from ..loader import load_scenario
+from ..utils.io import write_json, write_json_and_hash
 
 
 class BundleCompileError(RuntimeError):
@@ -31,41 +31,43 @@ def compile_single_scenario_bundle(
     out_root = Path(out_dir)
     out_root.mkdir(parents=True, exist_ok=True)
 
-    scenario_checksum = _sha256_file(original_path)
+    # The bundle directory name depends on the checksum, so read the scenario
+    # once, hash those bytes and write the same bytes into the bundle.
+    scenario_bytes = original_path.read_bytes()
+    scenario_checksum = hashlib.sha256(scenario_bytes).hexdigest()
     bundle_hash = _bundle_hash(client_id or "default", scenario_id, scenario_checksum)
 
-    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    now = datetime.now(timezone.utc)
+    stamp = now.strftime("%Y%m%dT%H%M%SZ")
     bundle_dir = out_root / f"bundle_{client_id or 'default'}_{stamp}_{bundle_hash[:8]}"
     bundle_dir.mkdir(parents=True, exist_ok=True)
 
     scenarios_dir = bundle_dir / "scenarios"
     scenarios_dir.mkdir(parents=True, exist_ok=True)
     scenario_filename = f"{scenario_id}{ext}"
+    scenario_rel = "scenarios/" + scenario_filename
     scenario_target = scenarios_dir / scenario_filename
-    shutil.copyfile(original_path, scenario_target)
+    scenario_target.write_bytes(scenario_bytes)
 
     manifest = _build_manifest(
         scenario_id=scenario_id,
         scenario_checksum=scenario_checksum,
-        scenario_rel_path=str(Path("scenarios") / scenario_filename),
+        scenario_rel_path=scenario_rel,
         client_id=client_id or "default",
         bundle_hash=bundle_hash,
     )
 
     manifest_path = bundle_dir / "bundle_manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, indent=2, sort_keys=True)
+    manifest_checksum = write_json_and_hash(manifest_path, manifest)
 
     build_meta_path = bundle_dir / "build_meta.json"
-    _write_build_meta(build_meta_path)
-
-    manifest_checksum = _sha256_file(manifest_path)
+    _write_build_meta(build_meta_path, now.isoformat())
 
     checksums_path = bundle_dir / "checksums.sha256"
     _write_checksums(
         checksums_path,
         [
-            (scenario_checksum, str(Path("scenarios") / scenario_filename)),
+            (scenario_checksum, scenario_rel),
             (manifest_checksum, "bundle_manifest.json"),
         ],
     )
@@ -117,6 +119,9 @@ def _build_manifest(
 
 
 def _bundle_hash(client_id: str, scenario_id: str, scenario_checksum: str) -> str:
+    # bundle_hash is recorded in bundle and run manifests and names the bundle
+    # directory, so the algorithm and payload layout must stay fixed (SHA-256
+    # over sorted-key stdlib JSON) regardless of which optional packages exist.
     stable_fields = {
         "client_id": client_id,
         "scenario_id": scenario_id,
@@ -126,25 +131,10 @@ def _bundle_hash(client_id: str, scenario_id: str, scenario_checksum: str) -> st
     return hashlib.sha256(payload).hexdigest()
 
 
-def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _write_checksums(path: Path, entries: list[tuple[str, str]]) -> None:
     with open(path, "w", encoding="utf-8") as handle:
-        for checksum, rel_path in entries:
-            handle.write(f"{checksum}  {rel_path}\n")
-
-
-def _write_build_meta(path: Path) -> None:
-    payload = {"created_at": _utc_now()}
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("".join(f"{checksum}  {rel_path}\n" for checksum, rel_path in entries))
 
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _write_build_meta(path: Path, created_at: str) -> None:
+    write_json(path, {"created_at": created_at})
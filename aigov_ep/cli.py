@@ -12,11 +12,8 @@ import json
 from pathlib import Path
 from typing import Callable, Iterable, Optional
 
-from aigov_ep.bundle.compiler import BundleCompileError, compile_single_scenario_bundle
-from aigov_ep.execute.runner import execute_scenario
-from aigov_ep.intake.validate import validate_intake
-from aigov_ep.judge.judge import judge_run
-from aigov_ep.reporting.generate import generate_report
+# Command implementations are imported inside their handlers so that
+# `aigov-ep --help` and single-command invocations only load what they use.
 
 
 def _make_handler(action: Callable[[], None]) -> Callable[[argparse.Namespace], int]:
@@ -31,11 +28,25 @@ def _make_handler(action: Callable[[], None]) -> Callable[[argparse.Namespace],
     return _handler
 
 
+def _validate_intake() -> None:
+    from aigov_ep.intake.validate import validate_intake
+
+    validate_intake()
+
+
+def _generate_report() -> None:
+    from aigov_ep.reporting.generate import generate_report
+
+    generate_report()
+
+
 def _run_offline_judge_stub() -> None:
     raise NotImplementedError("run_offline_judge: NOT IMPLEMENTED (skeleton)")
 
 
 def _execute_handler(args: argparse.Namespace) -> int:
+    from aigov_ep.execute.runner import execute_scenario
+
     config = {}
     if args.config:
         try:
@@ -77,6 +88,8 @@ def _execute_handler(args: argparse.Namespace) -> int:
 
 
 def _bundle_handler(args: argparse.Namespace) -> int:
+    from aigov_ep.bundle.compiler import BundleCompileError, compile_single_scenario_bundle
+
     try:
         result = compile_single_scenario_bundle(args.scenario, args.out, args.client_id)
     except BundleCompileError as exc:
@@ -91,6 +104,8 @@ def _bundle_handler(args: argparse.Namespace) -> int:
 
 
 def _judge_handler(args: argparse.Namespace) -> int:
+    from aigov_ep.judge.judge import judge_run
+
     run_dir = Path(args.run_dir)
     if not run_dir.exists():
         print(f"ERROR: run directory not found: {run_dir}")
@@ -120,8 +135,8 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers.required = True
 
     command_map = [
-        ("intake", validate_intake),
-        ("report", generate_report),
+        ("intake", _validate_intake),
+        ("report", _generate_report),
     ]
 
     for name, action in command_map:
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List
 
+from .utils.io import write_json
+
 
 LIMITATIONS = [
     "Heuristic detection only; results may include false positives or miss context.",
@@ -44,8 +46,8 @@ def build_evidence_pack(
 
 
 def write_evidence_pack(path: str, evidence_pack: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(evidence_pack, handle, indent=2, sort_keys=True)
+    # Non-ASCII text is written as UTF-8, not \u escapes; see utils.io.dumps_json.
+    write_json(Path(path), evidence_pack)
 
 
 def _utc_now() -> str:
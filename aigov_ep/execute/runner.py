@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-import uuid
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 
 from ..artifacts.manifests import write_run_manifest
 from ..loader import load_scenario
 from ..targets import get_target
-from ..utils.io import read_json, write_json
+from ..utils.io import dumps_json, write_json_and_hash
 
 
 @dataclass
@@ -22,6 +23,8 @@ class ExecuteResult:
     transcript_path: str
     run_meta_path: str
     scenario_json_path: str
+    transcript: List[Dict[str, Any]] = field(default_factory=list)
+    run_meta: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -33,6 +36,55 @@ class RunResult:
     run_meta: Dict[str, Any]
 
 
+class TranscriptWriter:
+    """Stream transcript entries into ``transcript.json`` as they are produced.
+
+    The file is byte-identical to ``write_json(path, entries)`` (entries are
+    encoded one at a time, so an entry that needs the stdlib fallback in
+    ``dumps_json`` may print exponent-form floats differently) and is hashed
+    incrementally, so the full serialized transcript is never held in memory.
+    Leaving the context always closes the array, keeping partial runs valid JSON.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle: Optional[BinaryIO] = None
+        self._digest = hashlib.sha256()
+        self._count = 0
+
+    def open(self) -> "TranscriptWriter":
+        self._handle = open(self.path, "wb")
+        return self
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        body = dumps_json(entry).replace(b"\n", b"\n  ")
+        self._write((b",\n  " if self._count else b"[\n  ") + body)
+        self._count += 1
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        self._write(b"\n]" if self._count else b"[]")
+        self._handle.close()
+        self._handle = None
+
+    @property
+    def checksum(self) -> str:
+        return self._digest.hexdigest()
+
+    def _write(self, data: bytes) -> None:
+        if self._handle is None:
+            raise RuntimeError("TranscriptWriter is not open")
+        self._handle.write(data)
+        self._digest.update(data)
+
+    def __enter__(self) -> "TranscriptWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
 def run_scenario(
     scenario_path: str,
     target_name: str,
@@ -40,8 +92,8 @@ def run_scenario(
     config: Dict[str, Any],
 ) -> RunResult:
     execute_result = execute_scenario(scenario_path, target_name, output_root, config)
-    transcript = read_json(Path(execute_result.transcript_path))
-    run_meta = read_json(Path(execute_result.run_meta_path))
+    transcript = execute_result.transcript
+    run_meta = execute_result.run_meta
     run_id = run_meta.get("run_id") or Path(execute_result.run_dir).name
 
     return RunResult(
@@ -98,42 +150,60 @@ def execute_scenario(
     if auditor_seed:
         messages.append({"role": "system", "content": auditor_seed})
 
+    transcript_path = run_dir / "transcript.json"
+    run_meta_path = run_dir / "run_meta.json"
+    scenario_json_path = run_dir / "scenario.json"
+
+    respond_delta = getattr(target, "respond_delta", None)
+    sent_count = 0
+
     turn_index = 0
     started_at = _utc_now()
 
-    for turn in scenario.get("turns", []):
-        role = turn.get("role", "user")
-        content = turn.get("content", "")
-        messages.append({"role": role, "content": content})
-        transcript.append(_entry(turn_index, role, content))
-        turn_index += 1
-
-        if role != "user":
-            continue
-
-        response = target.respond(messages)
-        assistant_content = response.get("content", "")
-        metadata = response.get("metadata") or {}
-
-        if metadata.get("mock_audit"):
-            audit_payload = metadata.get("mock_audit")
-            if isinstance(audit_payload, dict):
-                leaked_fields = audit_payload.get("leaked_fields") or []
-                audit_payload = {
-                    "leaked_fields": leaked_fields,
-                    "turn_index": turn_index,
-                }
-                assistant_content = _append_mock_audit(assistant_content, audit_payload)
-                metadata["mock_audit"] = audit_payload
-        if http_audit is not None:
-            http_audit.append(metadata.get("http_audit"))
-        if http_raw_response is not None:
-            http_raw_response.append(metadata.get("http_raw_response"))
-
-        messages.append({"role": "assistant", "content": assistant_content})
-        transcript.append(_entry(turn_index, "assistant", assistant_content, metadata or None))
-        turn_index += 1
-
+    with TranscriptWriter(transcript_path) as transcript_writer:
+
+        def _record(entry: Dict[str, Any]) -> None:
+            transcript.append(entry)
+            transcript_writer.append(entry)
+
+        for turn in scenario.get("turns", []):
+            role = turn.get("role", "user")
+            content = turn.get("content", "")
+            messages.append({"role": role, "content": content})
+            _record(_entry(turn_index, role, content))
+            turn_index += 1
+
+            if role != "user":
+                continue
+
+            if respond_delta is not None:
+                response = respond_delta(messages[sent_count:])
+                sent_count = len(messages)
+            else:
+                response = target.respond(messages)
+            assistant_content = response.get("content", "")
+            metadata = response.get("metadata") or {}
+
+            if metadata.get("mock_audit"):
+                audit_payload = metadata.get("mock_audit")
+                if isinstance(audit_payload, dict):
+                    leaked_fields = audit_payload.get("leaked_fields") or []
+                    audit_payload = {
+                        "leaked_fields": leaked_fields,
+                        "turn_index": turn_index,
+                    }
+                    assistant_content = _append_mock_audit(assistant_content, audit_payload)
+                    metadata["mock_audit"] = audit_payload
+            if http_audit is not None:
+                http_audit.append(metadata.get("http_audit"))
+            if http_raw_response is not None:
+                http_raw_response.append(metadata.get("http_raw_response"))
+
+            messages.append({"role": "assistant", "content": assistant_content})
+            _record(_entry(turn_index, "assistant", assistant_content, metadata or None))
+            turn_index += 1
+
+    transcript_checksum = transcript_writer.checksum
     finished_at = _utc_now()
     run_meta = {
         "run_id": run_id,
@@ -147,13 +217,8 @@ def execute_scenario(
         "http_raw_response": http_raw_response,
     }
 
-    transcript_path = run_dir / "transcript.json"
-    run_meta_path = run_dir / "run_meta.json"
-    scenario_json_path = run_dir / "scenario.json"
-
-    write_json(transcript_path, transcript)
-    write_json(run_meta_path, run_meta)
-    write_json(scenario_json_path, scenario)
+    run_meta_checksum = write_json_and_hash(run_meta_path, run_meta)
+    scenario_checksum = write_json_and_hash(scenario_json_path, scenario)
     write_run_manifest(
         run_dir=run_dir,
         scenario_source_path=Path(scenario_path),
@@ -162,6 +227,11 @@ def execute_scenario(
         run_meta_path=run_meta_path,
         target_name=target_name,
         target_config=target_config,
+        scenario_checksum=scenario_checksum,
+        transcript_checksum=transcript_checksum,
+        run_meta_checksum=run_meta_checksum,
+        now=finished_at,
+        config_safe=getattr(target_cls, "sanitized_config_safe", False),
     )
 
     return ExecuteResult(
@@ -170,6 +240,8 @@ def execute_scenario(
         transcript_path=str(transcript_path),
         run_meta_path=str(run_meta_path),
         scenario_json_path=str(scenario_json_path),
+        transcript=transcript,
+        run_meta=run_meta,
     )
 
 
@@ -208,5 +280,5 @@ def _utc_now() -> str:
 
 def _build_run_id() -> str:
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    suffix = uuid.uuid4().hex[:8]
+    suffix = os.urandom(4).hex()
     return f"{stamp}_{suffix}"
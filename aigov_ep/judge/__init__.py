@@ -1,5 +1,5 @@
 """Judge adapter."""
 
-from .judge import run_judge
+from .judge import run_judge, run_judge_batch
 
-__all__ = ["run_judge"]
+__all__ = ["run_judge", "run_judge_batch"]
@@ -5,19 +5,54 @@ Target adapter registry.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Type
+import importlib
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Type, Union
 
 from .base import TargetAdapter
-from .http_target import HttpTargetAdapter
-from .mock_llm import MockTargetAdapter
-from .scripted import ScriptedMockTargetAdapter
 
 
-TARGETS: Dict[str, Type[TargetAdapter]] = {
-    HttpTargetAdapter.name: HttpTargetAdapter,
-    MockTargetAdapter.name: MockTargetAdapter,
-    ScriptedMockTargetAdapter.name: ScriptedMockTargetAdapter,
-}
+class _TargetRegistry(MutableMapping):
+    """Adapter name -> class, importing built-in adapters on first lookup.
+
+    Built-ins are registered as ``"module:attr"`` paths, so a run only pays for
+    the adapter it uses. Assigning a class registers a custom adapter.
+    """
+
+    def __init__(self, entries: Dict[str, Union[str, Type[TargetAdapter]]]) -> None:
+        self._entries = dict(entries)
+
+    def __getitem__(self, name: str) -> Type[TargetAdapter]:
+        entry = self._entries[name]
+        if isinstance(entry, str):
+            module_name, _, attr = entry.partition(":")
+            entry = self._entries[name] = getattr(importlib.import_module(module_name), attr)
+        return entry
+
+    def __setitem__(self, name: str, adapter: Type[TargetAdapter]) -> None:
+        self._entries[name] = adapter
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        # Membership must not import the adapter.
+        return name in self._entries
+
+
+TARGETS: "MutableMapping[str, Type[TargetAdapter]]" = _TargetRegistry(
+    {
+        "http": "aigov_ep.targets.http_target:HttpTargetAdapter",
+        "mock-llm": "aigov_ep.targets.mock_llm:MockTargetAdapter",
+        "scripted": "aigov_ep.targets.scripted:ScriptedMockTargetAdapter",
+    }
+)
 
 
 def get_target(name: str) -> Type[TargetAdapter]:
@@ -7,7 +7,18 @@ from typing import Any, Dict, List
 
 
 class TargetAdapter(ABC):
+    """Base target adapter.
+
+    Adapters may also define ``respond_delta(new_messages)``. The runner then
+    passes only the messages added since the previous call (the system seed and
+    first user turn on the first call) and the adapter keeps its own history.
+    Adapters without it receive the full conversation through ``respond``.
+    """
+
     name = "base"
+    # Set to True only if the adapter's config can never contain secrets; run
+    # manifests then record it without the redaction walk.
+    sanitized_config_safe = False
 
     def __init__(self, scenario: Dict[str, Any], config: Dict[str, Any]) -> None:
         self.scenario = scenario
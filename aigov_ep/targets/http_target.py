@@ -24,10 +24,20 @@ class HttpTargetAdapter(TargetAdapter):
         self.leak_profile = config.get("leak_profile")
         self.use_llm = config.get("use_llm")
         self.session_id = str(config.get("session_id") or config.get("run_id") or "aigov-eval")
+        self._history: List[Dict[str, str]] = []
 
     def respond(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        return self._send(_normalize_messages(messages))
+
+    def respond_delta(self, new_messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        # The service is stateless, so the full history is still sent, but each
+        # message is normalized only once across the run.
+        self._history.extend(_normalize_messages(new_messages))
+        return self._send(self._history)
+
+    def _send(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
-            "messages": _normalize_messages(messages),
+            "messages": messages,
             "session_id": self.session_id,
         }
         if self.leak_mode is not None:
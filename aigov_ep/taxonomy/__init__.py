@@ -5,9 +5,10 @@ Provides versioned signal taxonomy with validation and synonym mapping.
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
-from typing import Any
+from typing import AbstractSet, Any
 
 # Default taxonomy paths (vendored contracts)
 _CONTRACTS_DIR = Path(__file__).parent / "contracts"
@@ -17,6 +18,7 @@ _DEFAULT_VERDICTS_PATH = _CONTRACTS_DIR / "verdicts.json"
 # Cached taxonomy data
 _signals_cache: dict | None = None
 _verdicts_cache: dict | None = None
+_allowed_ids_cache: frozenset[str] | None = None
 
 
 def load_taxonomy(path: Path | str | None = None) -> dict:
@@ -72,10 +74,20 @@ def get_taxonomy_version(path: Path | str | None = None) -> str:
     return load_taxonomy(path).get("taxonomy_version", "unknown")
 
 
-def get_allowed_signal_ids(path: Path | str | None = None) -> set[str]:
-    """Get set of valid signal IDs from taxonomy."""
+def get_allowed_signal_ids(path: Path | str | None = None) -> frozenset[str]:
+    """Get set of valid signal IDs from taxonomy.
+
+    The set is immutable so the default taxonomy's IDs can be shared across calls.
+    """
+    global _allowed_ids_cache
+
+    if path is None or Path(path) == _DEFAULT_SIGNALS_PATH:
+        if _allowed_ids_cache is None:
+            _allowed_ids_cache = frozenset(load_taxonomy().get("signal_ids", []))
+        return _allowed_ids_cache
+
     taxonomy = load_taxonomy(path)
-    return set(taxonomy.get("signal_ids", []))
+    return frozenset(taxonomy.get("signal_ids", []))
 
 
 def get_signal_metadata(path: Path | str | None = None) -> dict[str, dict]:
@@ -126,7 +138,7 @@ SIGNAL_SYNONYMS: dict[str, str] = {
 }
 
 
-def normalize_signal(signal: str, allowed: set[str] | None = None) -> tuple[str | None, bool]:
+def normalize_signal(signal: str, allowed: AbstractSet[str] | None = None) -> tuple[str | None, bool]:
     """Normalize a signal to canonical taxonomy ID.
 
     Args:
@@ -156,7 +168,7 @@ def normalize_signal(signal: str, allowed: set[str] | None = None) -> tuple[str
     return None, False
 
 
-def validate_signals(signals: list[str], allowed: set[str] | None = None) -> dict[str, list[str]]:
+def validate_signals(signals: list[str], allowed: AbstractSet[str] | None = None) -> dict[str, list[str]]:
     """Validate and normalize a list of signals.
 
     Args:
@@ -189,6 +201,7 @@ def validate_signals(signals: list[str], allowed: set[str] | None = None) -> dic
     }
 
 
+@functools.lru_cache(maxsize=8)
 def normalize_verdict(verdict: str) -> str:
     verdicts = _load_verdicts()
     legacy_aliases = verdicts.get("legacy_aliases", {})
@@ -0,0 +1,48 @@
+"""Shared checksum helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Union
+
+PathLike = Union[str, os.PathLike]
+
+_CHUNK_SIZE = 1 << 20
+_MMAP_MAX_SIZE = 1 << 20
+
+
+def sha256_file(path: PathLike) -> str:
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return hashlib.sha256().hexdigest()
+        if size <= _MMAP_MAX_SIZE:
+            # Scenario/manifest files are small: hash the whole mapping in one update.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        return _sha256_stream(handle)
+
+
+def sha256_files(paths: Sequence[PathLike], max_workers: int = 4) -> List[str]:
+    """Hash independent files concurrently; hashlib releases the GIL while hashing."""
+    if len(paths) < 2:
+        return [sha256_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(sha256_file, paths))
+
+
+def _sha256_stream(handle) -> str:
+    # Python < 3.11: reuse one buffer instead of allocating per chunk.
+    digest = hashlib.sha256()
+    buffer = memoryview(bytearray(_CHUNK_SIZE))
+    while True:
+        size = handle.readinto(buffer)
+        if not size:
+            break
+        digest.update(buffer[:size])
+    return digest.hexdigest()
@@ -0,0 +1,114 @@
+"""Shared HTTP helpers (keep-alive JSON POST over stdlib http.client)."""
+
+from __future__ import annotations
+
+import http.client
+import select
+import threading
+import urllib.error
+import urllib.request
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# One keep-alive connection per (scheme, host) per thread, so concurrent
+# callers (e.g. run_judge_batch) never share a connection.
+_local = threading.local()
+
+# Failures while writing the request: the server cannot have acted on it, so a
+# pooled connection may be retried. Once the request is out it is never resent
+# (a judge call is billed even if the response is lost).
+_SEND_ERRORS = (
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def post_json(url: str, body: bytes, headers: Dict[str, str], timeout: float) -> Tuple[int, bytes]:
+    """POST ``body`` to ``url`` and return ``(status, response_bytes)``.
+
+    Connections are reused across calls, saving a TCP+TLS handshake per
+    request. Non-2xx responses are returned, not raised. Only failures before
+    the request is written are retried; errors after that are raised.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or _uses_proxy(parts.scheme, parts.hostname or ""):
+        return _post_urllib(url, body, headers, timeout)
+
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    while True:
+        conn, reused = _connection(key, timeout)
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+        except _SEND_ERRORS:
+            _drop(key)
+            if reused:
+                # The server closed an idle pooled connection; retry on a fresh one.
+                continue
+            raise
+        except Exception:
+            _drop(key)
+            raise
+        try:
+            response = conn.getresponse()
+            data = response.read()
+        except Exception:
+            _drop(key)
+            raise
+        if response.will_close:
+            _drop(key)
+        return response.status, data
+
+
+def _connection(key: Tuple[str, str], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+    pool = getattr(_local, "connections", None)
+    if pool is None:
+        pool = _local.connections = {}
+    conn = pool.get(key)
+    if conn is not None and _is_dropped(conn):
+        # Closed by the server while idle: reconnect instead of sending into it.
+        _drop(key)
+        conn = None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    scheme, netloc = key
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    conn = conn_cls(netloc, timeout=timeout)
+    pool[key] = conn
+    return conn, False
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket only becomes readable when the peer closed it.
+    if conn.sock is None:
+        return False
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _drop(key: Tuple[str, str]) -> None:
+    conn = getattr(_local, "connections", {}).pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+
+def _post_urllib(url: str, body: bytes, headers: Dict[str, str], timeout: float) -> Tuple[int, bytes]:
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.getcode(), response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
@@ -2,16 +2,89 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import re
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson silently parses integers outside the 64-bit range as floats. Any run
+# of 19+ digits (even inside a string) sends the payload to the stdlib instead.
+_WIDE_DIGITS = re.compile(rb"\d{19}")
+_WIDE_DIGITS_STR = re.compile(r"\d{19}")
+
 
 def read_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(path, "rb") as handle:
+        return loads_json(handle.read())
+
+
+def loads_json(data: bytes | str) -> Any:
+    wide_digits = _WIDE_DIGITS_STR if isinstance(data, str) else _WIDE_DIGITS
+    if orjson is not None and not wide_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN); keep stdlib semantics.
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
 
 
 def write_json(path: Path, obj: Any) -> None:
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(obj, handle, indent=2, sort_keys=True)
+    with open(path, "wb") as handle:
+        handle.write(dumps_json(obj))
+
+
+def write_json_and_hash(path: Path, obj: Any) -> str:
+    """Write ``obj`` as JSON and return the SHA-256 of the bytes written."""
+    payload = dumps_json(obj)
+    with open(path, "wb") as handle:
+        handle.write(payload)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode ``obj`` as indented, key-sorted UTF-8 JSON.
+
+    With or without orjson the bytes match ``json.dumps(obj, indent=2,
+    sort_keys=True, ensure_ascii=False)``, except for floats that Python prints
+    in exponent form (``abs(x) >= 1e16`` or ``< 1e-4``): orjson writes ``1e16``
+    and ``1e-7`` where the stdlib writes ``1e+16`` and ``1e-07``. Values orjson
+    cannot encode the same way (non-str keys, integers wider than 64 bits,
+    lone surrogates, NaN/Infinity) go through the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN/Infinity as null. The walk over ``obj`` is only
+            # paid when the output contains a null at all.
+            if b"null" not in payload or not _has_non_finite(obj):
+                return payload
+    # Lone surrogates cannot be encoded as UTF-8; backslashreplace writes them
+    # as the same \udXXX escapes ensure_ascii=True would produce.
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8", "backslashreplace")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
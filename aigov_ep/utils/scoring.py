@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
-import json
+import re
 from typing import Any, Dict, List, Optional
 
+from .io import loads_json
+
+
+_MOCK_AUDIT_RE = re.compile(r"^<<MOCK_AUDIT>>(.*)$", re.MULTILINE)
+
 
 def extract_mock_audit(transcript: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     for entry in transcript:
         if entry.get("role") != "assistant":
             continue
         content = entry.get("content", "")
-        for line in content.splitlines():
-            if line.startswith("<<MOCK_AUDIT>>"):
-                raw = line.replace("<<MOCK_AUDIT>>", "", 1).strip()
-                try:
-                    payload = json.loads(raw)
-                except json.JSONDecodeError:
-                    return None
-                if isinstance(payload, dict):
-                    return payload
+        for match in _MOCK_AUDIT_RE.finditer(content):
+            try:
+                payload = loads_json(match.group(1).strip())
+            except ValueError:
+                return None
+            if isinstance(payload, dict):
+                return payload
     return None
 
 
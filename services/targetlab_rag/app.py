@@ -2,28 +2,58 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
 import json
 import math
+import asyncio
+import atexit
 import os
+import pickle
+import queue
 import datetime
 import subprocess
 import re
+import threading
+from array import array
+import time
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI
+from fastapi import BackgroundTasks, FastAPI
 from pydantic import BaseModel
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import re2
+except Exception:  # pragma: no cover - optional dependency
+    re2 = None
 
 from data.generate_corpus import generate_corpus
 
 
 DATA_DIR = Path(__file__).parent / "data"
 CORPUS_DIR = DATA_DIR / "corpus"
-TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Pickled index next to corpus.jsonl; bump the format when the index layout changes.
+INDEX_CACHE_NAME = "index.pkl"
+INDEX_CACHE_FORMAT = 6
+# RE2 (linear-time DFA) for the tokenizer when installed; same matches as `re`.
+TOKEN_RE = (re2 or re).compile(r"[a-z0-9]+")
 OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_OPENROUTER_MODEL = "z-ai/glm-4.5-air:free"
 
+# Shared keep-alive pool so LLM calls don't pay a TCP+TLS handshake each turn.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 class Message(BaseModel):
     role: str
@@ -48,19 +78,47 @@ app = FastAPI()
 
 _INDEX: Optional[Dict[str, Any]] = None
 
+# (query term counts, top_k) -> ranked (chunk index, score) pairs for _INDEX.
+_RETRIEVAL_CACHE: "OrderedDict[Tuple[Tuple[Tuple[str, int], ...], int], Tuple[Tuple[int, float], ...]]" = OrderedDict()
+_RETRIEVAL_LOCK = threading.Lock()
+_RETRIEVAL_CACHE_MAX = 512
+
+# run_id -> {"manifest", "flushed_at", "dirty"}, least recently used first.
+_MANIFESTS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_MANIFEST_LOCK = threading.Lock()
+_MANIFEST_FLUSH_INTERVAL = 5.0
+_MANIFEST_CACHE_MAX = 1024
+
+# run_id -> open retrieval_trace.jsonl handle, least recently used first.
+_TRACE_HANDLES: "OrderedDict[str, BinaryIO]" = OrderedDict()
+_TRACE_LOCK = threading.Lock()
+_TRACE_HANDLES_MAX = 64
+
+# (run_id, encoded line) records for the writer thread; None asks it to stop.
+_TRACE_QUEUE: "queue.SimpleQueue[Optional[Tuple[str, bytes]]]" = queue.SimpleQueue()
+_TRACE_BATCH_MAX = 256
+_TRACE_WRITER: Optional[threading.Thread] = None
+_TRACE_WRITER_LOCK = threading.Lock()
+
 
 @app.on_event("startup")
 def _startup() -> None:
     _load_corpus()
 
 
+@app.on_event("shutdown")
+def _shutdown() -> None:
+    _flush_run_manifests()
+    _shutdown_traces()
+
+
 @app.get("/health")
 def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
 @app.post("/chat")
-def chat(request: ChatRequest) -> Dict[str, Any]:
+async def chat(request: ChatRequest, background_tasks: BackgroundTasks) -> Dict[str, Any]:
     mode = request.mode or Mode()
     policy_mode = mode.policy_mode.lower()
     leak_profile = mode.leak_profile.lower()
@@ -68,47 +126,49 @@ def chat(request: ChatRequest) -> Dict[str, Any]:
     leak_after = max(1, int(mode.leak_after))
 
     last_user = _last_user_message(request.messages)
+    lowered_user = last_user.lower()
     user_turns = sum(1 for msg in request.messages if msg.role == "user")
 
     should_leak = (
         policy_mode == "leaky"
         and user_turns >= leak_after
-        and subject_name.lower() in last_user.lower()
+        and subject_name.lower() in lowered_user
     )
 
+    # Decide the deterministic leak first: when it applies it replaces whatever
+    # the LLM would say, so the OpenRouter round-trip is skipped entirely.
+    field = None
+    if should_leak:
+        if leak_profile == "pii":
+            field = _detect_pii_field(lowered_user)
+        elif leak_profile == "special_category":
+            field = _detect_special_field(lowered_user)
+    deterministic_override = bool(field)
+
     query = last_user
-    hits = _retrieve(query, top_k=mode.top_k)
-    context_snippets = _format_context_snippets(hits, max(1, int(mode.top_k)))
+    ranked = _rank_chunks(query, top_k=mode.top_k)
+    hits = _hits(ranked)
 
     assistant_message = _default_response(policy_mode)
+    leaked_fields: List[str] = []
     used_llm = False
     model_name = None
-    if _should_use_llm():
+    if deterministic_override:
+        leaked_fields = [field]
+        assistant_message = _build_leak_message(subject_name, field)
+    elif _should_use_llm():
+        context_snippets = _format_context_snippets(ranked, max(1, int(mode.top_k)))
         model_name = _get_openrouter_model()
         try:
-            assistant_message = _generate_llm_response(policy_mode, last_user, context_snippets, model_name)
+            # Blocking HTTP call: run it off the event loop.
+            assistant_message = await asyncio.to_thread(
+                _generate_llm_response, policy_mode, last_user, context_snippets, model_name
+            )
             used_llm = True
         except requests.RequestException:
             assistant_message = _default_response(policy_mode)
             used_llm = False
 
-    leaked_fields: List[str] = []
-    deterministic_override = False
-
-    if should_leak:
-        field = None
-        if leak_profile == "pii":
-            field = _detect_pii_field(last_user)
-        elif leak_profile == "special_category":
-            field = _detect_special_field(last_user)
-
-        if field:
-            leaked_fields = [field]
-            assistant_message = _build_leak_message(subject_name, field)
-            deterministic_override = True
-        elif not used_llm:
-            assistant_message = _default_response(policy_mode)
-
     citations = [{"doc_id": hit["doc_id"], "chunk_id": hit["chunk_id"]} for hit in hits[:2] if hit["score"] > 0]
     leak_mode = "deterministic_override" if deterministic_override else policy_mode
     notes = "deterministic leak injected" if deterministic_override else ""
@@ -132,8 +192,11 @@ def chat(request: ChatRequest) -> Dict[str, Any]:
         },
     }
 
+    # Trace lines are queued for the writer thread; the manifest update runs in
+    # the threadpool after the response is sent. Neither touches disk here.
+    run_id = os.getenv("TARGETLAB_RUN_ID") or request.session_id
     _emit_retrieval_trace(
-        run_id=os.getenv("TARGETLAB_RUN_ID") or request.session_id,
+        run_id=run_id,
         turn_id=str(user_turns),
         query=query,
         hits=hits,
@@ -142,7 +205,7 @@ def chat(request: ChatRequest) -> Dict[str, Any]:
         model=model_name if used_llm else None,
         policy_mode=policy_mode,
     )
-    _emit_run_manifest(run_id=os.getenv("TARGETLAB_RUN_ID") or request.session_id)
+    background_tasks.add_task(_emit_run_manifest, run_id=run_id)
 
     return response
 
@@ -151,8 +214,13 @@ def _utc_iso_ts() -> str:
     return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_git_commit_sha() -> str:
-    """Get current git commit SHA, or 'unknown' if unavailable."""
+    """Get current git commit SHA, or 'unknown' if unavailable.
+
+    Cached: the checkout cannot change under a running process, and forking git
+    per /chat request dominated the manifest write.
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -181,10 +249,6 @@ def _emit_retrieval_trace(
 ) -> None:
     """Best-effort append-only retrieval trace emission."""
     try:
-        trace_dir = Path("/runs") / "targetlab_rag" / str(run_id)
-        trace_dir.mkdir(parents=True, exist_ok=True)
-        trace_path = trace_dir / "retrieval_trace.jsonl"
-
         record = {
             "ts": _utc_iso_ts(),
             "run_id": str(run_id),
@@ -198,54 +262,223 @@ def _emit_retrieval_trace(
             "policy_mode": policy_mode,
         }
 
-        with trace_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _enqueue_trace_line(str(run_id), _dumps_line(record))
     except Exception as exc:
         # Sandbox target: never crash the request for trace write failures.
         print(f"[targetlab_rag] trace_write_failed: {exc}")
 
 
-def _emit_run_manifest(*, run_id: str) -> None:
-    """Best-effort run manifest creation/update."""
-    try:
-        manifest_dir = Path("/runs") / "targetlab_rag" / str(run_id)
-        manifest_dir.mkdir(parents=True, exist_ok=True)
-        manifest_path = manifest_dir / "run_manifest.json"
+def _enqueue_trace_line(run_id: str, line: bytes) -> None:
+    _ensure_trace_writer()
+    _TRACE_QUEUE.put((run_id, line))
 
-        now = _utc_iso_ts()
 
-        # Preserve created_at if manifest exists
-        if manifest_path.exists():
-            existing = json.loads(manifest_path.read_text(encoding="utf-8"))
-            created_at = existing.get("created_at", now)
+def _ensure_trace_writer() -> None:
+    # Started lazily (not on startup) so it also runs without a server lifespan
+    # and is created in the worker process rather than before a fork.
+    global _TRACE_WRITER
+    writer = _TRACE_WRITER
+    if writer is not None and writer.is_alive():
+        return
+    with _TRACE_WRITER_LOCK:
+        if _TRACE_WRITER is None or not _TRACE_WRITER.is_alive():
+            _TRACE_WRITER = threading.Thread(
+                target=_trace_writer_loop, name="targetlab-trace-writer", daemon=True
+            )
+            _TRACE_WRITER.start()
+
+
+def _trace_writer_loop() -> None:
+    """Drain queued trace lines, writing each run's batch with a single write."""
+    stop = False
+    while not stop:
+        batch = [_TRACE_QUEUE.get()]
+        while len(batch) < _TRACE_BATCH_MAX:
+            try:
+                batch.append(_TRACE_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        lines_by_run: Dict[str, List[bytes]] = {}
+        for item in batch:
+            if item is None:
+                stop = True
+                continue
+            run_id, line = item
+            lines_by_run.setdefault(run_id, []).append(line)
+
+        for run_id, lines in lines_by_run.items():
+            try:
+                _append_trace_lines(run_id, lines)
+            except Exception as exc:
+                print(f"[targetlab_rag] trace_write_failed: {exc}")
+
+
+def _stop_trace_writer() -> None:
+    """Write out everything queued so far and stop the writer thread."""
+    global _TRACE_WRITER
+    with _TRACE_WRITER_LOCK:
+        writer, _TRACE_WRITER = _TRACE_WRITER, None
+        if writer is None or not writer.is_alive():
+            return
+        _TRACE_QUEUE.put(None)
+    writer.join(timeout=5.0)
+
+
+def _append_trace_lines(run_id: str, lines: List[bytes]) -> None:
+    """Append to the run's trace through a kept-open handle (no open/close per turn)."""
+    with _TRACE_LOCK:
+        handle = _TRACE_HANDLES.get(run_id)
+        if handle is None:
+            trace_dir = _run_dir(run_id)
+            trace_dir.mkdir(parents=True, exist_ok=True)
+            handle = (trace_dir / "retrieval_trace.jsonl").open("ab")
+            _TRACE_HANDLES[run_id] = handle
+            while len(_TRACE_HANDLES) > _TRACE_HANDLES_MAX:
+                _TRACE_HANDLES.popitem(last=False)[1].close()
         else:
-            created_at = now
+            _TRACE_HANDLES.move_to_end(run_id)
+        try:
+            handle.write(b"".join(lines))
+            # Flush per batch so readers of the JSONL never see a partial line.
+            handle.flush()
+        except Exception:
+            _TRACE_HANDLES.pop(run_id, None)
+            handle.close()
+            raise
 
-        # Build manifest per spec
-        manifest = {
-            "schema_version": "run_manifest_v0",
-            "run_id": str(run_id),
-            "target": {
-                "name": "targetlab_rag",
-                "service_version": _get_git_commit_sha(),
-            },
-            "created_at": created_at,
-            "updated_at": now,
-            "artifacts": {
-                "retrieval_trace": "retrieval_trace.jsonl",
-                "result_trace": None,
-                "notes": None,
-            },
-        }
 
-        # Write manifest
-        with manifest_path.open("w", encoding="utf-8") as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
-            f.write("\n")
+def _close_trace_handles() -> None:
+    with _TRACE_LOCK:
+        while _TRACE_HANDLES:
+            _, handle = _TRACE_HANDLES.popitem()
+            try:
+                handle.close()
+            except Exception as exc:
+                print(f"[targetlab_rag] trace_close_failed: {exc}")
+
+
+def _shutdown_traces() -> None:
+    _stop_trace_writer()
+    _close_trace_handles()
+
+
+# Also drain on interpreter exit when the app is used without a server lifespan.
+atexit.register(_shutdown_traces)
+
+
+def _emit_run_manifest(*, run_id: str) -> None:
+    """Best-effort run manifest creation/update.
+
+    The manifest is kept in memory and only rewritten on the first request for
+    a run, then at most every _MANIFEST_FLUSH_INTERVAL seconds; pending
+    updated_at changes are flushed on shutdown.
+    """
+    try:
+        run_id = str(run_id)
+        now = _utc_iso_ts()
+        with _MANIFEST_LOCK:
+            entry = _MANIFESTS.get(run_id)
+            if entry is None:
+                entry = {"manifest": _new_run_manifest(run_id, now), "flushed_at": None}
+                _MANIFESTS[run_id] = entry
+                _evict_run_manifests()
+            else:
+                _MANIFESTS.move_to_end(run_id)
+            entry["manifest"]["updated_at"] = now
+            flushed_at = entry["flushed_at"]
+            if flushed_at is None or time.monotonic() - flushed_at >= _MANIFEST_FLUSH_INTERVAL:
+                _flush_run_manifest(run_id, entry)
+            else:
+                entry["dirty"] = True
     except Exception as exc:
         print(f"[targetlab_rag] manifest_write_failed: {exc}")
 
 
+def _new_run_manifest(run_id: str, now: str) -> Dict[str, Any]:
+    manifest_path = _run_dir(run_id) / "run_manifest.json"
+
+    # Preserve created_at if manifest exists
+    if manifest_path.exists():
+        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+        created_at = existing.get("created_at", now)
+    else:
+        created_at = now
+
+    # Build manifest per spec
+    return {
+        "schema_version": "run_manifest_v0",
+        "run_id": run_id,
+        "target": {
+            "name": "targetlab_rag",
+            "service_version": _get_git_commit_sha(),
+        },
+        "created_at": created_at,
+        "updated_at": now,
+        "artifacts": {
+            "retrieval_trace": "retrieval_trace.jsonl",
+            "result_trace": None,
+            "notes": None,
+        },
+    }
+
+
+def _flush_run_manifest(run_id: str, entry: Dict[str, Any]) -> None:
+    # Caller holds _MANIFEST_LOCK.
+    manifest_dir = _run_dir(run_id)
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    with (manifest_dir / "run_manifest.json").open("wb") as f:
+        f.write(_dumps_manifest(entry["manifest"]))
+    entry["flushed_at"] = time.monotonic()
+    entry["dirty"] = False
+
+
+def _evict_run_manifests() -> None:
+    # Caller holds _MANIFEST_LOCK; least recently used runs are written out and dropped.
+    while len(_MANIFESTS) > _MANIFEST_CACHE_MAX:
+        run_id, entry = _MANIFESTS.popitem(last=False)
+        if entry.get("dirty"):
+            _flush_run_manifest(run_id, entry)
+
+
+def _flush_run_manifests() -> None:
+    with _MANIFEST_LOCK:
+        for run_id, entry in _MANIFESTS.items():
+            if not entry.get("dirty"):
+                continue
+            try:
+                _flush_run_manifest(run_id, entry)
+            except Exception as exc:
+                print(f"[targetlab_rag] manifest_write_failed: {exc}")
+
+
+# Pending updated_at changes would otherwise be lost when there is no lifespan.
+atexit.register(_flush_run_manifests)
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Compact single-line JSON (UTF-8, unescaped) for the JSONL trace."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record) + b"\n"
+        except TypeError:
+            pass
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _dumps_manifest(manifest: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(manifest, option=orjson.OPT_INDENT_2) + b"\n"
+        except TypeError:
+            pass
+    return (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _run_dir(run_id: str) -> Path:
+    return Path("/runs") / "targetlab_rag" / str(run_id)
+
+
 def _load_corpus() -> None:
     global _INDEX
     if _INDEX is not None:
@@ -255,9 +488,20 @@ def _load_corpus() -> None:
     if not corpus_path.exists():
         generate_corpus(CORPUS_DIR)
 
+    corpus_bytes = corpus_path.read_bytes()
+    corpus_hash = hashlib.blake2b(corpus_bytes).hexdigest()
+    index = _read_index_cache(corpus_hash)
+    if index is None:
+        index = _build_corpus_index(corpus_bytes.decode("utf-8"))
+        _write_index_cache(corpus_hash, index)
+    with _RETRIEVAL_LOCK:
+        _RETRIEVAL_CACHE.clear()
+    _INDEX = index
+
+
+def _build_corpus_index(corpus_text: str) -> Dict[str, Any]:
     chunks: List[Dict[str, Any]] = []
-    text_by_id: Dict[str, str] = {}
-    for line in corpus_path.read_text(encoding="utf-8").splitlines():
+    for line in corpus_text.splitlines():
         if not line.strip():
             continue
         record = json.loads(line)
@@ -265,65 +509,168 @@ def _load_corpus() -> None:
         chunk_id = record["chunk_id"]
         text = record["text"]
         chunk_key = f"{doc_id}:{chunk_id}"
-        text_by_id[chunk_key] = text
-        chunks.append({"doc_id": doc_id, "chunk_id": chunk_id, "text": text})
+        chunks.append({"doc_id": doc_id, "chunk_id": chunk_id, "key": chunk_key, "text": text})
 
-    idf, chunk_terms = _build_index(chunks)
-    _INDEX = {
-        "chunks": chunks,
-        "idf": idf,
-        "chunk_terms": chunk_terms,
-        "text_by_id": text_by_id,
-    }
+    index = _build_index(chunks)
+    index["chunks"] = chunks
+    return index
 
 
-def _build_index(chunks: List[Dict[str, Any]]) -> tuple[Dict[str, float], List[Dict[str, int]]]:
-    doc_freq: Dict[str, int] = {}
-    chunk_terms: List[Dict[str, int]] = []
+def _read_index_cache(corpus_hash: str) -> Optional[Dict[str, Any]]:
+    """Load the pickled index if it was built from this exact corpus."""
+    try:
+        with (CORPUS_DIR / INDEX_CACHE_NAME).open("rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("format") != INDEX_CACHE_FORMAT
+        or cached.get("corpus_hash") != corpus_hash
+    ):
+        return None
+    return cached.get("index")
+
+
+def _write_index_cache(corpus_hash: str, index: Dict[str, Any]) -> None:
+    """Best-effort index cache write; a read-only data dir just means rebuilding."""
+    cache_path = CORPUS_DIR / INDEX_CACHE_NAME
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump(
+                {"format": INDEX_CACHE_FORMAT, "corpus_hash": corpus_hash, "index": index},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:
+        tmp_path.unlink(missing_ok=True)
+        print(f"[targetlab_rag] index_cache_write_failed: {exc}")
 
-    for chunk in chunks:
-        tokens = _tokenize(chunk["text"])
-        terms: Dict[str, int] = {}
-        for token in tokens:
-            terms[token] = terms.get(token, 0) + 1
-        chunk_terms.append(terms)
-        for term in set(terms.keys()):
-            doc_freq[term] = doc_freq.get(term, 0) + 1
+
+def _build_index(chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build per-term idf and term-major CSR postings over ``chunks``.
+
+    Postings for term id ``t`` are ``post_chunks[post_ptr[t]:post_ptr[t + 1]]``
+    (chunk indices, ascending) with parallel ``post_counts`` (term frequencies),
+    stored as flat int arrays instead of one dict per chunk. ``idf[t]`` is a
+    float64 array indexed by the same term id. ``zero_order`` lists every chunk
+    index by ``(doc_id, chunk_id)``, the ranking order among zero-score chunks.
+    """
+    vocab: Dict[str, int] = {}
+    postings: List[List[Tuple[int, int]]] = []
+
+    for idx, chunk in enumerate(chunks):
+        for term, count in _term_counts(chunk["text"]).items():
+            term_id = vocab.setdefault(term, len(vocab))
+            if term_id == len(postings):
+                postings.append([])
+            postings[term_id].append((idx, count))
+
+    post_ptr = array("i", [0])
+    post_chunks = array("i")
+    post_counts = array("i")
+    for term_postings in postings:
+        for idx, count in term_postings:
+            post_chunks.append(idx)
+            post_counts.append(count)
+        post_ptr.append(len(post_chunks))
 
     total = max(1, len(chunks))
-    idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
-    return idf, chunk_terms
+    idf = array("d", (math.log((1 + total) / (1 + len(term_postings))) + 1 for term_postings in postings))
+    zero_order = array(
+        "i", sorted(range(len(chunks)), key=lambda idx: (chunks[idx]["doc_id"], chunks[idx]["chunk_id"]))
+    )
+    return {
+        "vocab": vocab,
+        "idf": idf,
+        "post_ptr": post_ptr,
+        "post_chunks": post_chunks,
+        "post_counts": post_counts,
+        "zero_order": zero_order,
+    }
 
 
 def _retrieve(query: str, top_k: int) -> List[Dict[str, Any]]:
+    return _hits(_rank_chunks(query, top_k))
+
+
+def _rank_chunks(query: str, top_k: int) -> List[Tuple[int, float]]:
+    """Return ``(chunk index, rounded score)`` for the best ``top_k`` chunks."""
     if not _INDEX:
         _load_corpus()
     index = _INDEX or {}
     chunks = index.get("chunks", [])
-    idf = index.get("idf", {})
-    chunk_terms = index.get("chunk_terms", [])
-
-    query_terms = _term_counts(query)
+    vocab = index.get("vocab", {})
+    idf = index.get("idf", array("d"))
+    post_ptr = index.get("post_ptr", array("i", [0]))
+    post_chunks = index.get("post_chunks", array("i"))
+    post_counts = index.get("post_counts", array("i"))
+    zero_order = index.get("zero_order", array("i"))
+
+    query_terms = _cached_term_counts(query)
     if not query_terms:
         return []
 
-    scored: List[Dict[str, Any]] = []
-    for idx, chunk in enumerate(chunks):
-        terms = chunk_terms[idx]
-        score = 0.0
-        for term, q_count in query_terms.items():
-            if term in terms:
-                score += float(q_count * terms[term] * idf.get(term, 0.0))
-        scored.append(
-            {
-                "doc_id": chunk["doc_id"],
-                "chunk_id": chunk["chunk_id"],
-                "score": round(score, 4),
-            }
-        )
-
-    scored.sort(key=lambda item: (-item["score"], item["doc_id"], item["chunk_id"]))
-    return scored[: max(1, int(top_k))]
+    limit = max(1, int(top_k))
+    # Keyed on the ordered term counts: queries differing only in case or
+    # punctuation share an entry, and the float summation order is part of the key.
+    cache_key = (query_terms, limit)
+    with _RETRIEVAL_LOCK:
+        cached = _RETRIEVAL_CACHE.get(cache_key)
+        if cached is not None:
+            _RETRIEVAL_CACHE.move_to_end(cache_key)
+            return list(cached)
+
+    # Only chunks sharing a term with the query are touched; terms are added in
+    # query order, so every chunk's float sum is the same as a full scan.
+    scores = [0.0] * len(chunks)
+    touched: set = set()
+    for term, q_count in query_terms:
+        term_id = vocab.get(term)
+        if term_id is None:
+            continue
+        weight = idf[term_id]
+        start, end = post_ptr[term_id], post_ptr[term_id + 1]
+        touched.update(post_chunks[start:end])
+        for idx, count in zip(post_chunks[start:end], post_counts[start:end]):
+            scores[idx] += float(q_count * count * weight)
+
+    # idf >= 1, so every touched chunk scores at least 1 and ranks ahead of the
+    # rest. Select among those (in index order, as a stable full sort on
+    # (-rounded score, doc_id, chunk_id) would), then fill from zero_order.
+    candidates = [(idx, round(scores[idx], 4)) for idx in sorted(touched)]
+    ranked_list = heapq.nsmallest(
+        limit,
+        candidates,
+        key=lambda item: (-item[1], chunks[item[0]]["doc_id"], chunks[item[0]]["chunk_id"]),
+    )
+    if len(ranked_list) < limit:
+        for idx in zero_order:
+            if idx in touched:
+                continue
+            ranked_list.append((idx, 0.0))
+            if len(ranked_list) == limit:
+                break
+    ranked = tuple(ranked_list)
+    with _RETRIEVAL_LOCK:
+        _RETRIEVAL_CACHE[cache_key] = ranked
+        while len(_RETRIEVAL_CACHE) > _RETRIEVAL_CACHE_MAX:
+            _RETRIEVAL_CACHE.popitem(last=False)
+    return list(ranked)
+
+
+def _hits(ranked: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+    chunks = (_INDEX or {}).get("chunks", [])
+    return [
+        {
+            "doc_id": chunks[idx]["doc_id"],
+            "chunk_id": chunks[idx]["chunk_id"],
+            "score": score,
+        }
+        for idx, score in ranked
+    ]
 
 
 def _tokenize(text: str) -> List[str]:
@@ -331,10 +678,14 @@ def _tokenize(text: str) -> List[str]:
 
 
 def _term_counts(text: str) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    for token in _tokenize(text):
-        counts[token] = counts.get(token, 0) + 1
-    return counts
+    # Counter counts in C and keeps first-occurrence order, which the scoring relies on.
+    return Counter(_tokenize(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_term_counts(text: str) -> Tuple[Tuple[str, int], ...]:
+    # Chat sessions resend the same queries; frozen so the cached value can't be mutated.
+    return tuple(_term_counts(text).items())
 
 
 def _last_user_message(messages: List[Message]) -> str:
@@ -350,26 +701,51 @@ def _default_response(policy_mode: str) -> str:
     return "I can help with general information."
 
 
-def _detect_pii_field(text: str) -> Optional[str]:
-    lowered = text.lower()
-    if "email" in lowered or "e-mail" in lowered:
-        return "email"
-    if "phone" in lowered or "mobile" in lowered or "number" in lowered:
-        return "phone"
-    if "address" in lowered or "street" in lowered or "strada" in lowered:
-        return "address"
+def _field_pattern(fields: Dict[str, List[str]]) -> "re.Pattern[str]":
+    # Zero-width lookahead so overlapping keywords are all seen in one scan.
+    groups = "|".join(
+        f"(?P<{field}>{'|'.join(map(re.escape, keywords))})" for field, keywords in fields.items()
+    )
+    return re.compile(f"(?=(?:{groups}))")
+
+
+_PII_FIELDS = {
+    "email": ["email", "e-mail"],
+    "phone": ["phone", "mobile", "number"],
+    "address": ["address", "street", "strada"],
+}
+_SPECIAL_FIELDS = {
+    "health": ["health", "medical", "diagnosis", "condition", "illness", "diabetes", "cancer", "hiv", "aids"],
+    "political": ["politic", "party", "vote", "election"],
+}
+_PII_RE = _field_pattern(_PII_FIELDS)
+_SPECIAL_RE = _field_pattern(_SPECIAL_FIELDS)
+_PII_PRIORITY = tuple(_PII_FIELDS)
+_SPECIAL_PRIORITY = tuple(_SPECIAL_FIELDS)
+
+
+def _match_field(pattern: "re.Pattern[str]", priority: Tuple[str, ...], lowered: str) -> Optional[str]:
+    """Return the highest-priority field with a keyword anywhere in ``lowered``."""
+    found = set()
+    for match in pattern.finditer(lowered):
+        field = match.lastgroup
+        if field == priority[0]:
+            return field
+        found.add(field)
+    for field in priority:
+        if field in found:
+            return field
     return None
 
 
-def _detect_special_field(text: str) -> Optional[str]:
-    lowered = text.lower()
-    health_keywords = ["health", "medical", "diagnosis", "condition", "illness", "diabetes", "cancer", "hiv", "aids"]
-    political_keywords = ["politic", "party", "vote", "election"]
-    if any(keyword in lowered for keyword in health_keywords):
-        return "health"
-    if any(keyword in lowered for keyword in political_keywords):
-        return "political"
-    return None
+def _detect_pii_field(lowered: str) -> Optional[str]:
+    """Detect the requested PII field; ``lowered`` must already be lower-case."""
+    return _match_field(_PII_RE, _PII_PRIORITY, lowered)
+
+
+def _detect_special_field(lowered: str) -> Optional[str]:
+    """Detect the requested special-category field; ``lowered`` must already be lower-case."""
+    return _match_field(_SPECIAL_RE, _SPECIAL_PRIORITY, lowered)
 
 
 def _build_leak_message(subject_name: str, field: str) -> str:
@@ -394,15 +770,16 @@ def _get_openrouter_model() -> str:
     return os.getenv("TARGETLAB_OPENROUTER_MODEL") or DEFAULT_OPENROUTER_MODEL
 
 
-def _format_context_snippets(hits: List[Dict[str, Any]], top_k: int) -> str:
+def _format_context_snippets(ranked: List[Tuple[int, float]], top_k: int) -> str:
     if not _INDEX:
         _load_corpus()
     index = _INDEX or {}
-    text_by_id = index.get("text_by_id", {})
+    chunks = index.get("chunks", [])
     lines: List[str] = []
-    for hit in hits[:top_k]:
-        chunk_key = f"{hit['doc_id']}:{hit['chunk_id']}"
-        text = text_by_id.get(chunk_key, "")
+    for idx, _ in ranked[:top_k]:
+        chunk = chunks[idx]
+        chunk_key = chunk["key"]
+        text = chunk["text"]
         lines.append(f"- [{chunk_key}] {text}".strip())
     if not lines:
         return "- (none)"
@@ -436,7 +813,7 @@ def _generate_llm_response(policy_mode: str, user_message: str, context_snippets
         "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
         "Content-Type": "application/json",
     }
-    response = requests.post(OPENROUTER_URL, headers=headers, json=payload, timeout=30)
+    response = _SESSION.post(OPENROUTER_URL, headers=headers, json=payload, timeout=30)
     response.raise_for_status()
     data = response.json()
     return data["choices"][0]["message"]["content"].strip()
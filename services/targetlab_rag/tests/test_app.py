@@ -1,6 +1,10 @@
+import itertools
+import json
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -10,6 +14,13 @@ sys.path.insert(0, str(SERVICE_DIR))
 import app as app_module  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _runs_in_tmp_path(monkeypatch, tmp_path: Path) -> None:
+    """Keep trace and manifest artifacts out of /runs."""
+    monkeypatch.setattr(app_module, "_run_dir", lambda run_id: tmp_path / str(run_id))
+    monkeypatch.delenv("TARGETLAB_RUN_ID", raising=False)
+
+
 def _post_chat(client: TestClient, payload: dict) -> dict:
     response = client.post("/chat", json=payload)
     assert response.status_code == 200
@@ -23,7 +34,7 @@ def test_chat_without_llm_does_not_call_openrouter(monkeypatch) -> None:
     def _raise_if_called(*args, **kwargs) -> None:
         raise AssertionError("OpenRouter should not be called when LLM is disabled")
 
-    monkeypatch.setattr(app_module.requests, "post", _raise_if_called)
+    monkeypatch.setattr(app_module._SESSION, "post", _raise_if_called)
 
     client = TestClient(app_module.app)
     payload = {
@@ -50,7 +61,7 @@ def test_chat_with_llm_uses_openrouter(monkeypatch) -> None:
     def _fake_post(*args, **kwargs) -> DummyResponse:
         return DummyResponse()
 
-    monkeypatch.setattr(app_module.requests, "post", _fake_post)
+    monkeypatch.setattr(app_module._SESSION, "post", _fake_post)
 
     client = TestClient(app_module.app)
     payload = {
@@ -68,17 +79,10 @@ def test_deterministic_leak_overrides_llm(monkeypatch) -> None:
     monkeypatch.setenv("TARGETLAB_USE_LLM", "1")
     monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
 
-    class DummyResponse:
-        def raise_for_status(self) -> None:
-            return None
-
-        def json(self) -> dict:
-            return {"choices": [{"message": {"content": "Refusal"}}]}
-
-    def _fake_post(*args, **kwargs) -> DummyResponse:
-        return DummyResponse()
+    def _raise_if_called(*args, **kwargs) -> None:
+        raise AssertionError("OpenRouter should not be called when a deterministic leak applies")
 
-    monkeypatch.setattr(app_module.requests, "post", _fake_post)
+    monkeypatch.setattr(app_module._SESSION, "post", _raise_if_called)
 
     client = TestClient(app_module.app)
     payload = {
@@ -89,7 +93,7 @@ def test_deterministic_leak_overrides_llm(monkeypatch) -> None:
     data = _post_chat(client, payload)
 
     assert "ion.popescu@example.com" in data["assistant_message"].lower()
-    assert data["server_audit"]["used_llm"] is True
+    assert data["server_audit"]["used_llm"] is False
     assert data["server_audit"]["leak_mode"] == "deterministic_override"
 
 
@@ -102,3 +106,53 @@ def test_run_manifest_helper() -> None:
 
     # Test manifest emission doesn't crash (best-effort)
     app_module._emit_run_manifest(run_id="test-run-id")
+
+
+def test_retrieval_traces_are_drained_on_shutdown(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("TARGETLAB_USE_LLM", raising=False)
+    # Fewer cached handles than runs, so the LRU closes and reopens traces.
+    monkeypatch.setattr(app_module, "_TRACE_HANDLES_MAX", 2)
+
+    session_ids = ["trace-a", "trace-b", "trace-c"]
+    turns = 5
+    with TestClient(app_module.app) as client:
+        for turn in range(turns):
+            for session_id in session_ids:
+                payload = {
+                    "session_id": session_id,
+                    "messages": [{"role": "user", "content": f"Tell me about the program ({turn})."}],
+                    "mode": {"policy_mode": "strict", "leak_profile": "pii", "leak_after": 1},
+                }
+                _post_chat(client, payload)
+
+    assert not app_module._TRACE_HANDLES
+    for session_id in session_ids:
+        lines = (tmp_path / session_id / "retrieval_trace.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == turns
+        records = [json.loads(line) for line in lines]
+        assert {record["run_id"] for record in records} == {session_id}
+
+
+def test_run_manifest_is_flushed_on_shutdown(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("TARGETLAB_USE_LLM", raising=False)
+    monkeypatch.setattr(app_module, "_MANIFESTS", OrderedDict())
+    # Only the first request writes the manifest; later updates stay pending.
+    monkeypatch.setattr(app_module, "_MANIFEST_FLUSH_INTERVAL", 3600.0)
+    ticks = itertools.count()
+    monkeypatch.setattr(app_module, "_utc_iso_ts", lambda: f"2026-01-01T00:00:{next(ticks):02d}Z")
+
+    with TestClient(app_module.app) as client:
+        for turn in range(3):
+            payload = {
+                "session_id": "manifest-run",
+                "messages": [{"role": "user", "content": f"Tell me about the program ({turn})."}],
+            }
+            _post_chat(client, payload)
+        manifest_path = tmp_path / "manifest-run" / "run_manifest.json"
+        before = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    after = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert after["created_at"] == before["created_at"]
+    assert after["updated_at"] > before["updated_at"]
+    assert after["updated_at"] == app_module._MANIFESTS["manifest-run"]["manifest"]["updated_at"]
+    assert not app_module._MANIFESTS["manifest-run"]["dirty"]
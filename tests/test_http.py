@@ -0,0 +1,114 @@
+import http.client
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from aigov_ep.utils import http as http_module  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.seen.append((self.path, self.client_address[1], body))
+        mode = self.path.strip("/")
+        if mode == "drop":
+            # Request received, connection closed before any response.
+            self.close_connection = True
+            return
+        status = 500 if mode == "error" else 200
+        payload = b'{"path": "%s"}' % self.path.encode("ascii")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        if mode == "close":
+            # Keep-alive was advertised; the server closes the idle socket anyway.
+            self.close_connection = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.seen: List[Tuple[str, int, bytes]] = []
+        self.closed = threading.Semaphore(0)
+
+    def shutdown_request(self, request) -> None:
+        super().shutdown_request(request)
+        self.closed.release()
+
+
+@pytest.fixture
+def server(monkeypatch) -> Iterator[Tuple[str, _Server]]:
+    monkeypatch.setattr(http_module, "_uses_proxy", lambda scheme, host: False)
+    httpd = _Server()
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+        for conn in getattr(http_module._local, "connections", {}).values():
+            conn.close()
+        http_module._local.__dict__.clear()
+
+
+def _post(url: str) -> Tuple[int, bytes]:
+    return http_module.post_json(url, b'{"q": 1}', {"Content-Type": "application/json"}, timeout=5)
+
+
+def test_post_json_reuses_connection(server) -> None:
+    base_url, httpd = server
+    seen = httpd.seen
+    assert _post(f"{base_url}/a") == (200, b'{"path": "/a"}')
+    assert _post(f"{base_url}/b") == (200, b'{"path": "/b"}')
+    assert [path for path, _, _ in seen] == ["/a", "/b"]
+    assert seen[0][1] == seen[1][1]
+    assert seen[0][2] == b'{"q": 1}'
+
+
+def test_post_json_reconnects_after_server_close(server) -> None:
+    base_url, httpd = server
+    seen = httpd.seen
+    assert _post(f"{base_url}/close")[0] == 200
+    assert httpd.closed.acquire(timeout=5)
+    assert _post(f"{base_url}/after")[0] == 200
+    # Sent exactly once each, the second on a new connection.
+    assert [path for path, _, _ in seen] == ["/close", "/after"]
+    assert seen[0][1] != seen[1][1]
+
+
+def test_post_json_does_not_resend_after_request_is_written(server) -> None:
+    base_url, httpd = server
+    seen = httpd.seen
+    assert _post(f"{base_url}/warm")[0] == 200
+    with pytest.raises(http.client.HTTPException):
+        _post(f"{base_url}/drop")
+    assert [path for path, _, _ in seen] == ["/warm", "/drop"]
+    # The failed connection is not reused.
+    assert _post(f"{base_url}/next")[0] == 200
+
+
+def test_post_json_returns_non_2xx(server) -> None:
+    base_url, httpd = server
+    seen = httpd.seen
+    assert _post(f"{base_url}/error") == (500, b'{"path": "/error"}')
+    assert _post(f"{base_url}/ok")[0] == 200
+    assert seen[0][1] == seen[1][1]
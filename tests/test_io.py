@@ -0,0 +1,60 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from aigov_ep.utils import io as io_module  # noqa: E402
+
+
+def _stdlib_bytes(obj) -> bytes:
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch) -> str:
+    if request.param == "orjson":
+        if io_module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(io_module, "orjson", None)
+    return request.param
+
+
+def test_dumps_json_matches_stdlib_layout(encoder) -> None:
+    obj = {"b": [1, 2.5, None, True], "a": {"name": "Ion Popescu ș Ünïcode", "empty": {}}, "c": []}
+    assert io_module.dumps_json(obj) == _stdlib_bytes(obj)
+
+
+def test_dumps_json_escapes_lone_surrogates(encoder, tmp_path: Path) -> None:
+    # e.g. an HTTP target reply cut in the middle of an emoji.
+    obj = json.loads('{"reply": "hi \\ud83d"}')
+    payload = io_module.dumps_json(obj)
+    assert payload == json.dumps(obj, indent=2, sort_keys=True).encode("ascii")
+    assert json.loads(payload) == obj
+
+    io_module.write_json(tmp_path / "reply.json", obj)
+    assert io_module.read_json(tmp_path / "reply.json") == obj
+
+
+def test_dumps_json_host_independent_cases(encoder) -> None:
+    cases = [
+        {2: "two", 10: "ten"},
+        {"id": 2**70},
+        {"score": float("nan"), "limit": float("inf"), "none": None},
+    ]
+    for obj in cases:
+        assert io_module.dumps_json(obj) == _stdlib_bytes(obj)
+
+
+def test_loads_json_keeps_wide_integers_exact(encoder) -> None:
+    # Outside the 64-bit range on both ends; orjson alone would return floats.
+    payload = b'{"big": 123456789012345678901, "low": -9223372036854775809, "id": "1234567890123456789012"}'
+    data = io_module.loads_json(payload)
+    assert data == {"big": 123456789012345678901, "low": -9223372036854775809, "id": "1234567890123456789012"}
+    assert isinstance(data["big"], int) and isinstance(data["low"], int)
+    assert io_module.loads_json(payload.decode("utf-8")) == data
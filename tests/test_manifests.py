@@ -0,0 +1,37 @@
+import json
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from aigov_ep.artifacts import manifests  # noqa: E402
+
+
+def _write_bundle_manifest(directory: Path, bundle_hash: str) -> None:
+    (directory / "bundle_manifest.json").write_text(json.dumps({"bundle_hash": bundle_hash}), encoding="utf-8")
+
+
+def test_bundle_info_tracks_manifests_created_and_removed(tmp_path: Path) -> None:
+    scenario_dir = tmp_path / "inner" / "scenarios"
+    scenario_dir.mkdir(parents=True)
+    scenario = scenario_dir / "scenario.yaml"
+    scenario.write_text("scenario_id: S\n", encoding="utf-8")
+
+    assert manifests._find_bundle_info(scenario) is None
+
+    _write_bundle_manifest(tmp_path, "outer")
+    assert manifests._find_bundle_info(scenario)["bundle_hash"] == "outer"
+
+    # A bundle compiled closer to the scenario takes over.
+    _write_bundle_manifest(tmp_path / "inner", "inner")
+    info = manifests._find_bundle_info(scenario)
+    assert info["bundle_hash"] == "inner"
+    assert info["bundle_dir"] == str((tmp_path / "inner").resolve())
+
+    (tmp_path / "inner" / "bundle_manifest.json").unlink()
+    assert manifests._find_bundle_info(scenario)["bundle_hash"] == "outer"
+
+    (tmp_path / "bundle_manifest.json").unlink()
+    assert manifests._find_bundle_info(scenario) is None
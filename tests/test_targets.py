@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from aigov_ep import targets  # noqa: E402
+from aigov_ep.targets.base import TargetAdapter  # noqa: E402
+
+
+def test_builtin_targets_resolve() -> None:
+    for name in ("http", "mock-llm", "scripted"):
+        adapter = targets.get_target(name)
+        assert issubclass(adapter, TargetAdapter)
+        assert targets.TARGETS[name] is adapter
+        assert adapter.name == name
+
+
+def test_registering_custom_target(monkeypatch) -> None:
+    class CustomAdapter(TargetAdapter):
+        name = "custom"
+
+    monkeypatch.setitem(targets.TARGETS, "custom", CustomAdapter)
+    assert targets.get_target("custom") is CustomAdapter
+    assert "custom" in dict(targets.TARGETS.items())
+
+
+def test_unknown_target_raises() -> None:
+    with pytest.raises(KeyError, match="Unknown target adapter"):
+        targets.get_target("missing")
+
+
+def test_adapters_are_imported_on_first_lookup() -> None:
+    code = (
+        "import sys\n"
+        "from aigov_ep.targets import TARGETS, get_target\n"
+        "assert 'mock-llm' in TARGETS\n"
+        "assert 'aigov_ep.targets.mock_llm' not in sys.modules\n"
+        "get_target('mock-llm')\n"
+        "assert 'aigov_ep.targets.mock_llm' in sys.modules\n"
+        "assert 'aigov_ep.targets.http_target' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)